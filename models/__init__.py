@@ -1,4 +1,4 @@
-from buffered import BufferedController
-from embedding import EmbeddingController
+from models.buffered import BufferedController
+from models.embedding import EmbeddingController
 from models.legacy.lstm import LSTMController
-from vanilla import VanillaController
+from models.vanilla import VanillaController
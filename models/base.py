@@ -1,22 +1,18 @@
-from __future__ import division
-
 from abc import ABCMeta, abstractmethod
 
 import torch
 import torch.nn as nn
-from torch.autograd import Variable
 
 from structs.simple import SimpleStruct
 
 
-class AbstractController(nn.Module):
+class AbstractController(nn.Module, metaclass=ABCMeta):
     """
     Abstract class for creating policy networks (controllers) that
     operate a neural data structure, such as a neural stack or a neural
     queue. To create a custom controller, create a class inhereting from
     this one that overrides self.__init__ and self.forward.
     """
-    __metaclass__ = ABCMeta
 
     def __init__(self, read_size, struct_type):
         """
@@ -39,7 +35,7 @@ class AbstractController(nn.Module):
         self._read_size = read_size
         self._read = None
 
-    def _init_struct(self, batch_size):
+    def _init_struct(self, batch_size, device=None):
         """
         Initializes the neural data structure to an empty state.
 
@@ -47,11 +43,17 @@ class AbstractController(nn.Module):
         :param batch_size: The number of trials in each mini-batch where
             this Controller is used
 
+        :type device: torch.device
+        :param device: The device on which the neural data structure
+            will be stored
+
         :return: None
         """
         if issubclass(self._struct_type, SimpleStruct):
-            self._read = Variable(torch.zeros([batch_size, self._read_size]))
-            self._struct = self._struct_type(batch_size, self._read_size)
+            self._read = torch.zeros([batch_size, self._read_size],
+                                     device=device)
+            self._struct = self._struct_type(batch_size, self._read_size,
+                                             device=device)
 
     @abstractmethod
     def _init_buffer(self, batch_size, xs):
@@ -97,7 +99,7 @@ class AbstractController(nn.Module):
 
         :return: None
         """
-        self._init_struct(batch_size)
+        self._init_struct(batch_size, device=xs.device)
         self._init_buffer(batch_size, xs)
         self._init_network(batch_size)
 
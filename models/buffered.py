@@ -1,11 +1,8 @@
-from __future__ import division
-
 import matplotlib.pyplot as plt
 import torch
-from torch.autograd import Variable
 
-from base import AbstractController
-from networks.feedforward import LinearSimpleStructNetwork
+from models.base import AbstractController
+from models.networks.feedforward import LinearSimpleStructNetwork
 from structs import Stack, Operation
 from structs.buffers import InputBuffer, OutputBuffer
 from structs.regularization import InterfaceRegTracker
@@ -83,7 +80,7 @@ class BufferedController(AbstractController):
 
         :return: None
         """
-        self._e_in = Variable(torch.zeros(batch_size))
+        self._e_in = torch.zeros(batch_size)
 
         self._buffer_in = InputBuffer(batch_size, self._input_size)
         self._buffer_out = OutputBuffer(batch_size, self._input_size)
@@ -106,8 +103,12 @@ class BufferedController(AbstractController):
         """
         x = self._buffer_in(self._e_in)
 
-        output, (v, u, d, e_in, e_out) = self._network(x, self._read)
-        self._e_in = e_in
+        output, instructions = self._network(x, self._read)
+        u = instructions[:, 0]
+        d = instructions[:, 1]
+        e_out = instructions[:, 3]
+        v = instructions[:, 4:]
+        self._e_in = instructions[:, 2]
         self._read = self._struct(v, u, d)
 
         self._buffer_out(output, e_out)
@@ -146,14 +147,15 @@ class BufferedController(AbstractController):
         self.init_controller(1, trace_x)
 
         self._network.start_log(num_steps)
-        for j in xrange(num_steps):
-            self.forward()
+        with torch.no_grad():
+            for j in range(num_steps):
+                self.forward()
         self._network.stop_log()
 
-        x_labels = ["x_" + str(i) for i in xrange(self._input_size)]
-        y_labels = ["y_" + str(i) for i in xrange(self._output_size)]
+        x_labels = ["x_" + str(i) for i in range(self._input_size)]
+        y_labels = ["y_" + str(i) for i in range(self._output_size)]
         i_labels = ["Pop", "Push", "Input", "Output"]
-        v_labels = ["v_" + str(i) for i in xrange(self._read_size)]
+        v_labels = ["v_" + str(i) for i in range(self._read_size)]
         labels = x_labels + y_labels + i_labels + v_labels
 
         plt.imshow(self._network.log_data, cmap="Greys",
@@ -1,13 +1,11 @@
 import torch
 import torch.autograd as autograd
-from torch.autograd import Variable
-from torch.autograd import Variable
 import torch.nn as nn
 import torch.nn.functional as F
 import torch.optim as optim
 import random
 
-from legacy.model import Controller as AbstractController
+from models.legacy.model import Controller as AbstractController
 
 torch.manual_seed(1)
 
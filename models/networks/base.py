@@ -1,18 +1,25 @@
+from __future__ import annotations
+
+import math
+import operator
 from abc import ABCMeta, abstractmethod
+from functools import reduce
+from typing import TYPE_CHECKING, Optional
 
-import numpy as np
+import torch
 import torch.nn as nn
-from torch.autograd import Variable
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
-class Network(nn.Module):
+class Network(nn.Module, metaclass=ABCMeta):
     """
     Abstract class for neural network Modules to be used in Controllers.
     Inherit from this class in order to create a custom architecture for
     a Controller, or to create a network compatible with a custom neural
     data structure.
     """
-    __metaclass__ = ABCMeta
 
     def __init__(self, input_size, read_size, output_size):
         """
@@ -50,13 +57,15 @@ class Network(nn.Module):
 
         :rtype: tuple
         :return: The first item of the tuple should contain the output
-            of the network. The second item should be a tuple containing
-            instructions for the neural data structure. For example, the
-            return value corresponding to the instructions
+            of the network. The second item should be a single tensor
+            containing instructions for the neural data structure, so
+            that the Controller can slice them without unpacking a
+            tuple at every time step. For example, the return value
+            corresponding to the instructions
                 - output y
                 - pop a strength u from the data structure
                 - push v with strength d to the data structure
-            is (y, (v, u, d))
+            is (y, i), where the columns of i are u, d, and then v
         """
         raise NotImplementedError("Missing implementation for forward")
 
@@ -72,8 +81,34 @@ class Network(nn.Module):
 
         :return: None
         """
-        n = tensor.data.shape[0]
-        tensor.data.normal_(0, 1. / np.sqrt(n))
+        n = tensor.shape[0]
+        nn.init.normal_(tensor, 0., 1. / math.sqrt(n))
+
+    @staticmethod
+    def _alloc_param_block(*shapes):
+        """
+        Allocates several Parameters as views of a single contiguous
+        block of memory, so that the weights of small layers are stored
+        next to each other.
+
+        :type shapes: torch.Size
+        :param shapes: The shapes of the Parameters to allocate
+
+        :rtype: list
+        :return: A list of uninitialized Parameters with the given
+            shapes, all sharing the same storage
+        """
+        sizes = [reduce(operator.mul, shape, 1) for shape in shapes]
+        block = torch.empty(sum(sizes))
+
+        params = []
+        offset = 0
+        for shape, size in zip(shapes, sizes):
+            view = block[offset:offset + size].view(*shape)
+            params.append(nn.Parameter(view))
+            offset += size
+
+        return params
 
     def init_network(self, batch_size):
         """
@@ -87,6 +122,16 @@ class Network(nn.Module):
         """
         pass
 
+    @property
+    def is_logging(self):
+        """
+        Whether or not data will be logged the next time self.forward
+        is called. Networks do not log data unless they override this.
+
+        :rtype: bool
+        """
+        return False
+
 
 class SimpleStructNetwork(Network):
     """
@@ -100,10 +145,12 @@ class SimpleStructNetwork(Network):
         """
         Constructor for the SimpleStructNetwork object. In addition to
         calling the base class constructor, this constructor initializes
-        private properties used for reporting. Logged data are stored in
-        self._log, a Numpy array whose columns contain the instructions
-        computed by the SimpleStructNetwork to the SimpleStruct at each
-        time step.
+        private properties used for reporting. While logging, data are
+        staged in a tensor on the same device as the Network, one row
+        per time step. When logging stops, they are copied to
+        self.log_data, a Numpy array whose columns contain the
+        instructions computed by the SimpleStructNetwork to the
+        SimpleStruct at each time step.
 
         :type input_size: int
         :param input_size: The size of input vectors to this Network
@@ -128,36 +175,45 @@ class SimpleStructNetwork(Network):
 
         # Initialize reporting tools
         self._logging = False  # Whether or not to log data
-        self.log_data = None  # A numpy array containing logged data
         self._log_data_size = 0  # The maximum number of entries to log
         self._curr_log_entry = 0  # The number of entries logged already
 
+        # A numpy array containing logged data
+        self.log_data: Optional[np.ndarray] = None
+        # A tensor staging data while logging
+        self._log_buffer: Optional[torch.Tensor] = None
+
         return
 
     """ Reporting """
 
     def init_log(self, log_data_size):
         """
-        Initializes self._log_data to an empty array of a specified
-        size.
+        Initializes self._log_buffer to an empty tensor of a specified
+        size. Each row holds the data logged at one time step, so that
+        every entry is written contiguously. The tensor is placed on the
+        same device as the Network, so that logging does not require a
+        device-to-host copy at every time step.
 
         :type log_data_size: int
-        :param log_data_size: The number of columns of self._log_data
+        :param log_data_size: The number of rows of self._log_buffer
             (i.e., the number of time steps for which data are logged)
 
         :return: None
         """
-        self.log_data = np.zeros([self._n_args + self._read_size +
-                                  self._input_size + self._output_size,
-                                  log_data_size])
+        device = next(self.parameters()).device
+        self._log_buffer = torch.zeros(log_data_size,
+                                       self._input_size + self._output_size +
+                                       self._n_args + self._read_size,
+                                       device=device)
         self._log_data_size = log_data_size
         self._curr_log_entry = 0
         return
 
     def start_log(self, log_data_size=None):
         """
-        Sets self._log to True, so that data will be logged the next
-        time self.forward is called.
+        Sets self._logging to True, so that data will be logged the
+        next time self.forward is called.
 
         :type log_data_size: int
         :param log_data_size: If a value is supplied for this argument,
@@ -172,18 +228,33 @@ class SimpleStructNetwork(Network):
 
     def stop_log(self):
         """
-        Sets self._log to False, so that data will no longer be logged
-        the next time self.forward is called.
+        Sets self._logging to False, so that data will no longer be
+        logged the next time self.forward is called. The data logged so
+        far are copied to self.log_data.
 
         :return: None
         """
         self._logging = False
+        if self._log_buffer is not None:
+            self.log_data = self._log_buffer.t().cpu().numpy()
         return
 
-    def _log(self, x, y, v, *instructions):
+    @property
+    def is_logging(self):
+        """
+        Whether or not data will be logged the next time self.forward
+        is called.
+
+        :rtype: bool
+        """
+        return self._logging
+
+    @torch.jit.unused
+    def _record(self, x, y, instructions):
         """
         Records the action of the Network at a particular time step to
-        self._log_data.
+        self._log_buffer. Logging is only supported in eager mode, so
+        this method is not compiled by torch.jit.script.
 
         :type x: Variable
         :param x: The input to the Network
@@ -191,11 +262,9 @@ class SimpleStructNetwork(Network):
         :type y: Variable
         :praam y: The output of the Network
 
-        :type v: Variable
-        :param v: The value that will be pushed to the data structure
-
-        :type instructions: list
-        :param instructions: Other data structure instructions
+        :type instructions: Variable
+        :param instructions: The data structure instructions, followed
+            by the value that will be pushed to the data structure
 
         :return: None
         """
@@ -205,19 +274,9 @@ class SimpleStructNetwork(Network):
         elif t >= self._log_data_size:
             return
 
-        x_start = 0
-        x_end = self._input_size
-        y_start = self._input_size
-        y_end = self._input_size + self._output_size
-        i_start = self._input_size + self._output_size
-        v_start = self._input_size + self._output_size + self._n_args
-
-        self.log_data[x_start:x_end, t] = x.data.numpy()
-        self.log_data[y_start:y_end, t] = y.data.numpy()
-        self.log_data[v_start:, t] = v.data.numpy()
-        for j in xrange(self._n_args):
-            instruction = instructions[j].data.numpy()
-            self.log_data[i_start + j, self._curr_log_entry] = instruction
+        # Only the first trial of the batch is logged
+        entry = torch.cat([x, y, instructions], 1)
+        self._log_buffer[t] = entry.data[0]
 
         self._curr_log_entry += 1
 
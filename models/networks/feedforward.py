@@ -1,14 +1,13 @@
 """
 Feedforward networks for use in Controllers.
 """
-
-from __future__ import division
+from typing import Tuple
 
 import torch
 import torch.nn as nn
 from torch.nn.functional import sigmoid
 
-from base import SimpleStructNetwork
+from models.networks.base import SimpleStructNetwork
 
 
 class LinearSimpleStructNetwork(SimpleStructNetwork):
@@ -50,7 +49,12 @@ class LinearSimpleStructNetwork(SimpleStructNetwork):
         # Create a Linear Module object
         nn_input_size = self._input_size + self._read_size
         nn_output_size = self._n_args + self._read_size + self._output_size
-        self._linear = nn.Linear(nn_input_size, nn_output_size)
+        # The Linear is built without storage, since its Parameters are
+        # replaced by views of a single block below
+        self._linear = nn.Linear(nn_input_size, nn_output_size,
+                                 device="meta")
+        self._linear.weight, self._linear.bias = self._alloc_param_block(
+            self._linear.weight.size(), self._linear.bias.size())
 
         # Initialize Module weights
         LinearSimpleStructNetwork.init_normal(self._linear.weight)
@@ -60,10 +64,13 @@ class LinearSimpleStructNetwork(SimpleStructNetwork):
             self._linear.bias.data[2] = 1.  # Encourage reading
             self._linear.bias.data[3] = 1.  # Encourage writing
 
-    def forward(self, x, r):
+    def forward(self, x: torch.Tensor,
+                r: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
         """
         Computes an output and data structure instructions using a
-        single linear layer.
+        single linear layer. This method only uses TorchScript
+        operations, so that the Network can be wrapped in
+        torch.jit.script (see VanillaController).
 
         :type x: Variable
         :param x: The input to this Network
@@ -72,21 +79,22 @@ class LinearSimpleStructNetwork(SimpleStructNetwork):
         :param r: The previous item read from the neural data structure
 
         :rtype: tuple
-        :return: A tuple of the form (y, (v, u, d)), interpreted as
+        :return: A tuple of the form (y, i), where the first n_args
+            columns of i are the instruction strengths and the rest of
+            i is the value to push. By default, this is interpreted as
             follows:
                 - output y
-                - pop a strength u from the data structure
-                - push v with strength d to the data structure
+                - pop a strength u = i[:, 0] from the data structure
+                - push v = i[:, 2:] with strength d = i[:, 1] to the
+                    data structure
         """
         nn_output = self._linear(torch.cat([x, r], 1))
 
         output = nn_output[:, self._n_args + self._read_size:].contiguous()
 
-        read_params = sigmoid(nn_output[:, :self._n_args + self._read_size])
-        v = read_params[:, self._n_args:].contiguous()
-        instructions = tuple(read_params[:, j].contiguous()
-                             for j in xrange(self._n_args))
+        instructions = sigmoid(nn_output[:, :self._n_args + self._read_size])
 
-        self._log(x, sigmoid(output), v, *instructions)
+        if self._logging:
+            self._record(x, sigmoid(output), instructions)
 
-        return output, ((v,) + instructions)
+        return output, instructions
@@ -2,14 +2,11 @@
 Recurrent networks for use in Controllers.
 """
 
-from __future__ import division
-
 import torch
 import torch.nn as nn
-from torch.autograd import Variable
 from torch.nn.functional import sigmoid
 
-from base import SimpleStructNetwork
+from models.networks.base import SimpleStructNetwork
 
 
 # https://pytorch.org/docs/stable/nn.html#lstmcell
@@ -81,7 +78,8 @@ class RNNSimpleStructNetwork(SimpleStructNetwork):
         :return: None
         """
         rnn_hidden_shape = (batch_size, self._rnn.hidden_size)
-        self._hidden = Variable(torch.zeros(rnn_hidden_shape))
+        device = next(self.parameters()).device
+        self._hidden = torch.zeros(rnn_hidden_shape, device=device)
 
     def init_network(self, batch_size):
         self._init_hidden(batch_size)
@@ -98,25 +96,26 @@ class RNNSimpleStructNetwork(SimpleStructNetwork):
         :param r: The previous item read from the neural data structure
 
         :rtype: tuple
-        :return: A tuple of the form (y, (v, u, d)), interpreted as
+        :return: A tuple of the form (y, i), where the first n_args
+            columns of i are the instruction strengths and the rest of
+            i is the value to push. By default, this is interpreted as
             follows:
                 - output y
-                - pop a strength u from the data structure
-                - push v with strength d to the data structure
+                - pop a strength u = i[:, 0] from the data structure
+                - push v = i[:, 2:] with strength d = i[:, 1] to the
+                    data structure
         """
         self._hidden = self._rnn(torch.cat([x, r], 1), self._hidden)
         nn_output = self._linear(self._hidden)
 
         output = nn_output[:, self._n_args + self._read_size:].contiguous()
 
-        read_params = sigmoid(nn_output[:, :self._n_args + self._read_size])
-        v = read_params[:, self._n_args:].contiguous()
-        instructions = tuple(read_params[:, j].contiguous()
-                             for j in xrange(self._n_args))
+        instructions = sigmoid(nn_output[:, :self._n_args + self._read_size])
 
-        self._log(x, sigmoid(output), v, *instructions)
+        if self._logging:
+            self._record(x, sigmoid(output), instructions)
 
-        return output, ((v,) + instructions)
+        return output, instructions
 
 class LSTMSimpleStructNetwork(SimpleStructNetwork):
     """
@@ -186,8 +185,9 @@ class LSTMSimpleStructNetwork(SimpleStructNetwork):
         :return: None
         """
         lstm_hidden_shape = (batch_size, self._lstm.hidden_size)
-        self._hidden = Variable(torch.zeros(lstm_hidden_shape))
-        self._cell_state = Variable(torch.zeros(lstm_hidden_shape))
+        device = next(self.parameters()).device
+        self._hidden = torch.zeros(lstm_hidden_shape, device=device)
+        self._cell_state = torch.zeros(lstm_hidden_shape, device=device)
 
     def init_network(self, batch_size):
         self._init_hidden(batch_size)
@@ -204,11 +204,14 @@ class LSTMSimpleStructNetwork(SimpleStructNetwork):
         :param r: The previous item read from the neural data structure
 
         :rtype: tuple
-        :return: A tuple of the form (y, (v, u, d)), interpreted as
+        :return: A tuple of the form (y, i), where the first n_args
+            columns of i are the instruction strengths and the rest of
+            i is the value to push. By default, this is interpreted as
             follows:
                 - output y
-                - pop a strength u from the data structure
-                - push v with strength d to the data structure
+                - pop a strength u = i[:, 0] from the data structure
+                - push v = i[:, 2:] with strength d = i[:, 1] to the
+                    data structure
         """
         self._hidden, self._cell_state = self._lstm(
             torch.cat([x, r], 1), (self._hidden, self._cell_state))
@@ -216,11 +219,9 @@ class LSTMSimpleStructNetwork(SimpleStructNetwork):
 
         output = nn_output[:, self._n_args + self._read_size:].contiguous()
 
-        read_params = sigmoid(nn_output[:, :self._n_args + self._read_size])
-        v = read_params[:, self._n_args:].contiguous()
-        instructions = tuple(read_params[:, j].contiguous()
-                             for j in xrange(self._n_args))
+        instructions = sigmoid(nn_output[:, :self._n_args + self._read_size])
 
-        self._log(x, sigmoid(output), v, *instructions)
+        if self._logging:
+            self._record(x, sigmoid(output), instructions)
 
-        return output, ((v,) + instructions)
+        return output, instructions
@@ -0,0 +1,168 @@
+import torch
+
+from models.networks.feedforward import LinearSimpleStructNetwork
+from models.vanilla import VanillaController
+from structs.testcase import testcase, test_module
+
+
+"""
+
+Unit test cases for the Controllers.
+
+"""
+
+@testcase(VanillaController)
+def test_more_steps_than_inputs():
+    """ Outputs are buffered for steps past the end of the input. """
+    controller = VanillaController(3, 2, 4)
+    controller.init_controller(2, torch.rand(2, 3, 3))
+    for _ in range(5):
+        controller.forward()
+
+    outputs = []
+    for _ in range(5):
+        y = controller.read_output()
+        assert y is not None
+        assert y.size() == (2, 4)
+        outputs.append(y)
+    assert controller.read_output() is None
+
+    sum(y.sum() for y in outputs).backward()
+    for param in controller.parameters():
+        assert param.grad is not None
+
+@testcase(VanillaController)
+def test_memo():
+    """ The last Network result is only reused in evaluation mode. """
+    controller = VanillaController(3, 2, 4, memo_threshold=float("inf"))
+    calls = []
+    controller._network.register_forward_hook(lambda *args: calls.append(1))
+
+    # The two steps after the input is read only see padding
+    controller.eval()
+    controller.init_controller(2, torch.rand(2, 1, 3))
+    for _ in range(3):
+        controller.forward()
+    assert len(calls) == 1
+    first = controller.read_output()
+    assert all(controller.read_output() is first for _ in range(2))
+
+    # A new input resets the memo
+    controller.init_controller(2, torch.rand(2, 1, 3))
+    assert controller._memo is None
+    controller.forward()
+    assert len(calls) == 2
+
+    # The threshold is ignored while training
+    controller.train()
+    controller.init_controller(2, torch.rand(2, 1, 3))
+    for _ in range(3):
+        controller.forward()
+    assert len(calls) == 5
+
+@testcase(VanillaController)
+def test_cuda_graphs():
+    """ CUDA graph replay matches eager mode. Skipped without a GPU. """
+    if not torch.cuda.is_available():
+        return
+
+    eager = VanillaController(3, 2, 4).cuda()
+    graphed = VanillaController(3, 2, 4, cuda_graphs=True).cuda()
+    graphed.load_state_dict(eager.state_dict())
+    xs = torch.rand(2, 3, 3, device="cuda")
+
+    outputs = []
+    for controller in (eager, graphed):
+        controller.eval()
+        controller.init_controller(2, xs)
+        with torch.no_grad():
+            for _ in range(5):
+                controller.forward()
+        outputs.append([controller.read_output() for _ in range(5)])
+
+    for y, y_graphed in zip(*outputs):
+        assert y_graphed.is_cuda
+        assert torch.allclose(y, y_graphed, atol=1e-5)
+
+@testcase(VanillaController)
+def test_amp():
+    """ Autocasting only applies on a GPU, within bfloat16 tolerance. """
+    devices = ["cpu"]
+    if torch.cuda.is_available():
+        devices.append("cuda")
+
+    for device in devices:
+        full = VanillaController(3, 2, 4).to(device)
+        amp = VanillaController(3, 2, 4, amp=True).to(device)
+        amp.load_state_dict(full.state_dict())
+        xs = torch.rand(2, 3, 3, device=device)
+
+        outputs = []
+        for controller in (full, amp):
+            controller.init_controller(2, xs)
+            for _ in range(3):
+                controller.forward()
+            outputs.append([controller.read_output() for _ in range(3)])
+
+        for y, y_amp in zip(*outputs):
+            assert y_amp.dtype == torch.float32
+            if device == "cpu":
+                assert torch.equal(y, y_amp)
+            else:
+                assert torch.allclose(y, y_amp, atol=5e-2)
+
+@testcase(LinearSimpleStructNetwork)
+def test_scripted_matches_eager():
+    """ The scripted Network computes the same values and gradients. """
+    network = LinearSimpleStructNetwork(3, 2, 4)
+    scripted = torch.jit.script(network)
+    x = torch.rand(2, 3)
+    r = torch.rand(2, 2)
+
+    results = []
+    for step in (network, scripted):
+        network.zero_grad()
+        output, instructions = step(x, r)
+        (output.sum() + instructions.sum()).backward()
+        grads = [p.grad.clone() for p in network.parameters()]
+        results.append((output, instructions, grads))
+
+    (y, i, grads), (y_s, i_s, grads_s) = results
+    assert torch.allclose(y, y_s)
+    assert torch.allclose(i, i_s)
+    for g, g_s in zip(grads, grads_s):
+        assert torch.allclose(g, g_s)
+
+@testcase(LinearSimpleStructNetwork)
+def test_param_block_shared():
+    """ The weight and bias stay in one block after updates. """
+    def shared(network):
+        weight = network._linear.weight.untyped_storage().data_ptr()
+        bias = network._linear.bias.untyped_storage().data_ptr()
+        return weight == bias
+
+    network = LinearSimpleStructNetwork(3, 2, 4)
+    assert network._linear.weight.device.type == "cpu"
+    assert shared(network)
+
+    optimizer = torch.optim.Adam(network.parameters())
+    output, instructions = network(torch.rand(2, 3), torch.rand(2, 2))
+    (output.sum() + instructions.sum()).backward()
+    optimizer.step()
+    assert shared(network)
+
+    network.load_state_dict(LinearSimpleStructNetwork(3, 2, 4).state_dict())
+    assert shared(network)
+
+@testcase(VanillaController)
+def test_scripted_conflicts():
+    """ scripted cannot be combined with torch.compile. """
+    try:
+        VanillaController(3, 2, 4, compiled=True, scripted=True)
+    except ValueError:
+        pass
+    else:
+        assert False
+
+if __name__ == "__main__":
+    test_module(globals())
@@ -1,11 +1,12 @@
-from __future__ import division
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import torch
-from torch.autograd import Variable
 
-from base import AbstractController
-from networks.feedforward import LinearSimpleStructNetwork
+from models.base import AbstractController
+from models.networks.feedforward import LinearSimpleStructNetwork
 from structs.simple import Stack
 
 
@@ -15,7 +16,9 @@ class VanillaController(AbstractController):
     """
 
     def __init__(self, input_size, read_size, output_size,
-                 network_type=LinearSimpleStructNetwork, struct_type=Stack):
+                 network_type=LinearSimpleStructNetwork, struct_type=Stack,
+                 compiled=False, memo_threshold=None, amp=False,
+                 cuda_graphs=False, scripted=False):
         """
         Constructor for the VanillaController object.
 
@@ -38,19 +41,90 @@ class VanillaController(AbstractController):
         :type network_type: type
         :param network_type: The type of the Network that will perform
             the neural network computations
+
+        :type compiled: bool
+        :param compiled: If True, the Network's forward pass will be
+            compiled with torch.compile. Only the Network is compiled,
+            since the size of the neural data structure changes at each
+            time step
+
+        :type memo_threshold: float
+        :param memo_threshold: If a value is supplied for this argument,
+            then in evaluation mode the Network will not be run again
+            when its input and the previous read both differ from those
+            of the last computed step by less than this amount.
+            Instead, the last result will be reused. This should only be
+            used with Networks that have no recurrent state
+
+        :type amp: bool
+        :param amp: If True, the Network will be run under bfloat16
+            autocasting when its input is on a GPU. This changes the
+            outputs slightly. The flag has no effect on the CPU, and
+            the neural data structure is always operated in full
+            precision
+
+        :type cuda_graphs: bool
+        :param cuda_graphs: If True, the Network's forward pass will be
+            compiled with torch.compile in "reduce-overhead" mode, which
+            replays each time step from a CUDA graph when running on a
+            GPU. This implies compiled. The neural data structure is
+            stored on the same device as the input, so the Controller
+            and its input must be moved to the GPU for this to have an
+            effect. This should only be used with Networks that have no
+            recurrent state
+
+        :type scripted: bool
+        :param scripted: If True, the Network will be wrapped in
+            torch.jit.script, so that its pointwise operations can be
+            fused. This cannot be combined with compiled or
+            cuda_graphs. The scripted Network shares its Parameters with
+            self._network, but keeps its own copy of other attributes,
+            so self._network is used instead while logging. This should
+            only be used with Networks that have no recurrent state and
+            whose forward is scriptable, such as
+            LinearSimpleStructNetwork
         """
+        if scripted and (compiled or cuda_graphs):
+            raise ValueError("scripted cannot be combined with compiled or "
+                             "cuda_graphs")
+
         super(VanillaController, self).__init__(read_size, struct_type)
-        self._read = None
+        self._read: Optional[torch.Tensor] = None
         self._network = network_type(input_size, read_size, output_size)
+
+        # Keep bound methods rather than Modules, so that the compiled
+        # step is not registered as a submodule and the state_dict keys
+        # of saved models are unchanged
+        self._compiled_network: Optional[Callable] = None
+        if compiled or cuda_graphs:
+            mode = "reduce-overhead" if cuda_graphs else "default"
+            self._compiled_network = torch.compile(self._network.forward,
+                                                   dynamic=False, mode=mode)
+        elif scripted:
+            self._compiled_network = torch.jit.script(self._network).forward
+        self._cuda_graphs = cuda_graphs
+
+        self._amp = amp
+        self._memo_threshold: Optional[float] = memo_threshold
+        # The last Network input and result computed
+        self._memo: Optional[Tuple[torch.Tensor, tuple]] = None
+
         self._input_size = input_size
         self._output_size = output_size
         self._read_size = read_size
 
-        self._buffer_in = None
-        self._buffer_out = None
+        self._buffer_in: Optional[torch.Tensor] = None
+        self._buffer_slices: Optional[List[torch.Tensor]] = None
+        self._buffer_out: Optional[List[torch.Tensor]] = None
+        self._out_read_idx = 0
 
         self._t = 0
-        self._zeros = None
+        self._zeros: Optional[torch.Tensor] = None
+        # Padding inputs, by batch size and device
+        self._zeros_cache: Dict[tuple, torch.Tensor] = {}
+
+        # Row labels for trace plots
+        self._trace_labels: Optional[List[str]] = None
 
     def _init_buffer(self, batch_size, xs):
         """
@@ -65,15 +139,32 @@ class VanillaController(AbstractController):
         :type xs: Variable
         :param xs: An array of values that will be placed on the input
             buffer. The dimensions should be [batch size, t, read size],
-            where t is the maximum length of a string represented in xs
+            where t is the maximum length of a string represented in xs.
+            The input buffer stores a contiguous copy of xs with
+            dimensions [t, batch size, read size], so that the input
+            read at each time step is a contiguous block of memory
 
         :return: None
         """
-        self._buffer_in = xs
+        self._buffer_in = xs.permute(1, 0, 2).contiguous()
+        self._buffer_slices = list(self._buffer_in.unbind(0))
+        self._memo = None
+
+        # Outputs are kept in a list rather than written into a tensor,
+        # since every in-place write would add a copy of the whole
+        # buffer to the backward pass
         self._buffer_out = []
+        self._out_read_idx = 0
 
         self._t = 0
-        self._zeros = Variable(torch.zeros(batch_size, self._input_size))
+
+        # The padding input never changes, so it is reused across batches
+        key = (batch_size, xs.device, xs.dtype)
+        if key not in self._zeros_cache:
+            self._zeros_cache[key] = torch.zeros(batch_size, self._input_size,
+                                                 device=xs.device,
+                                                 dtype=xs.dtype)
+        self._zeros = self._zeros_cache[key]
 
     """ Neural Network Computation """
 
@@ -92,11 +183,61 @@ class VanillaController(AbstractController):
 
         x = self._read_input()
 
-        output, (v, u, d) = self._network(x, self._read)
+        output, instructions = self._run_network(x)
+        u = instructions[:, 0]
+        d = instructions[:, 1]
+        v = instructions[:, 2:]
         self._read = self._struct(v, u, d)
 
         self._write_output(output)
 
+    def _run_network(self, x):
+        """
+        Runs the Network on an input and the previous item read from the
+        neural data structure.
+
+        :type x: Variable
+        :param x: The input to the Network
+
+        :rtype: tuple
+        :return: The output and data structure instructions computed by
+            the Network
+        """
+        memoize = (self._memo_threshold is not None and not self.training
+                   and not self._network.is_logging)
+        if memoize:
+            key = torch.cat([x, self._read], 1)
+            if self._memo is not None:
+                # Branching on the difference reads it back to the host,
+                # which synchronizes with the device at every step
+                diff = (key - self._memo[0]).abs().max()
+                if diff.item() < self._memo_threshold:
+                    return self._memo[1]
+
+        # Logging updates Python state at every step, which would force
+        # the compiled step to be rebuilt, so it always runs eagerly
+        network = self._network
+        if (self._compiled_network is not None
+                and not self._network.is_logging):
+            network = self._compiled_network
+
+        if self._amp and x.is_cuda:
+            with torch.autocast(device_type=x.device.type,
+                                dtype=torch.bfloat16):
+                output, instructions = network(x, self._read)
+            result = (output.float(), instructions.float())
+        else:
+            result = network(x, self._read)
+
+        if self._cuda_graphs and x.is_cuda:
+            # The outputs of a CUDA graph are overwritten when it is
+            # replayed, but the data structure keeps the pushed values
+            result = tuple(r.clone() for r in result)
+
+        if memoize:
+            self._memo = (key, result)
+        return result
+
     """ Accessors """
 
     def _read_input(self):
@@ -106,9 +247,9 @@ class VanillaController(AbstractController):
         :rtype: Variable
         :return: The next vector from the input buffer
         """
-        if self._t < self._buffer_in.size(1):
+        if self._t < len(self._buffer_slices):
             self._t += 1
-            return self._buffer_in[:, self._t - 1, :]
+            return self._buffer_slices[self._t - 1]
         else:
             return self._zeros
 
@@ -119,8 +260,9 @@ class VanillaController(AbstractController):
         :rtype: Variable
         :return: The next vector from the output buffer
         """
-        if len(self._buffer_out) > 0:
-            return self._buffer_out.pop(0)
+        if self._out_read_idx < len(self._buffer_out):
+            self._out_read_idx += 1
+            return self._buffer_out[self._out_read_idx - 1]
         else:
             return None
 
@@ -153,16 +295,22 @@ class VanillaController(AbstractController):
 
         max_length = trace_x.data.shape[1]
 
+        # Every step depends on the previous read, so the steps cannot be
+        # batched, but no autograd graph needs to be recorded for a trace
         self._network.start_log(max_length)
-        for j in xrange(max_length):
-            self.forward()
+        with torch.no_grad():
+            for j in range(max_length):
+                self.forward()
         self._network.stop_log()
 
-        x_labels = ["x_" + str(i) for i in xrange(self._input_size)]
-        y_labels = ["y_" + str(i) for i in xrange(self._output_size)]
-        i_labels = ["Pop", "Push"]
-        v_labels = ["v_" + str(i) for i in xrange(self._read_size)]
-        labels = x_labels + y_labels + i_labels + v_labels
+        # The labels only depend on the sizes of the Controller
+        if self._trace_labels is None:
+            x_labels = ["x_" + str(i) for i in range(self._input_size)]
+            y_labels = ["y_" + str(i) for i in range(self._output_size)]
+            i_labels = ["Pop", "Push"]
+            v_labels = ["v_" + str(i) for i in range(self._read_size)]
+            self._trace_labels = x_labels + y_labels + i_labels + v_labels
+        labels = self._trace_labels
 
         plt.imshow(self._network.log_data, cmap="Greys",
                    interpolation="nearest")
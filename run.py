@@ -11,6 +11,7 @@ Example usage:
 """
 
 import argparse
+from dataclasses import is_dataclass
 
 from tasks import *
 from tasks.configs import *
@@ -35,18 +36,18 @@ if __name__ == "__main__":
     if not issubclass(task, Task):
         raise ValueError("{} is not Task".format(args.task))
 
+    kwargs = {}
+    if(args.loadpath):
+        kwargs['load_path'] = args.loadpath
+    if(args.savepath):
+        kwargs['save_path'] = args.savepath
+
     if args.config is None:
-        config = {}
+        task(**kwargs).run_experiment()
     else:
         if args.config not in globals():
             raise ValueError("Unknown parameter configuration {}".format(args.config))
         config = globals()[args.config]
-        if not isinstance(config, dict):
-            raise ValueError("{} is not a dictionary".format(args.config))
-
-    if(args.loadpath):
-        config['load_path'] = args.loadpath
-    if(args.savepath):
-        config['save_path'] = args.savepath
-
-    task(**config).run_experiment()
+        if not is_dataclass(config) or isinstance(config, type):
+            raise ValueError("{} is not a configuration".format(args.config))
+        task(config, **kwargs).run_experiment()
@@ -1 +1 @@
-from simple import Stack, Queue, Operation
+from structs.simple import Stack, Queue, Operation
@@ -2,10 +2,9 @@ from abc import ABCMeta, abstractmethod
 
 import torch
 import torch.nn as nn
-from torch.autograd import Variable
 
 
-class Struct(nn.Module):
+class Struct(nn.Module, metaclass=ABCMeta):
     """
     Abstract class for implementing neural data structures, such as
     stacks, queues, and dequeues. Data structures inheriting from this
@@ -18,14 +17,16 @@ class Struct(nn.Module):
     operations. Please see the documentation for self.pop. self.push,
     and self.read for more details.
     """
-    __metaclass__ = ABCMeta
 
-    def __init__(self, batch_size, embedding_size):
+    def __init__(self, batch_size, embedding_size, device=None):
         """
         Constructor for the Struct object. The data of the Struct are
-        stored in two parts. self.contents is a matrix containing a list
-        of vectors. Each of these vectors is assigned a number known as
-        its "strength," which his stored in self.strengths. For an item
+        stored in two parts. self.contents is a list of vectors, one
+        [batch size x embedding size] tensor per item. Each of these
+        vectors is assigned a number known as its "strength," which is
+        stored in the corresponding entry of self.strengths. Keeping the
+        items in lists means that adding an item does not copy the rest
+        of the Struct. For an item
         in self.contents to be assigned a strength of 1 means that it is
         fully in the data structure, and for it to have a strength of 0
         means it is deleted (but perhaps was previously in the
@@ -38,14 +39,19 @@ class Struct(nn.Module):
         :type embedding_size: int
         :param embedding_size: The size of the vectors stored in this
             Struct
+
+        :type device: torch.device
+        :param device: The device on which the Struct allocates its
+            tensors. By default, tensors are allocated on the CPU
         """
         super(Struct, self).__init__()
         self.batch_size = batch_size
         self.embedding_size = embedding_size
-        self._zeros = Variable(torch.zeros(batch_size))
+        self.device = device
+        self._zeros = torch.zeros(batch_size, device=device)
 
-        self.contents = Variable(torch.FloatTensor(0))
-        self.strengths = Variable(torch.FloatTensor(0))
+        self.contents = []
+        self.strengths = []
 
         return
 
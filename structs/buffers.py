@@ -1,4 +1,4 @@
-from simple import Queue
+from structs.simple import Queue
 
 
 class InputBuffer(Queue):
@@ -1,8 +1,5 @@
-from __future__ import print_function, division
-
 import torch
-from torch.autograd import Variable
-from testcase import testcase, test_module, is_close
+from structs.testcase import testcase, test_module, is_close
 
 
 def binary_reg_fn(strengths):
@@ -30,7 +27,7 @@ class InterfaceRegTracker(object):
         """
         self._weight_decay = weight_decay
         self._reg_fn = reg_fn
-        self._loss = Variable(torch.zeros([1]))
+        self._loss = torch.zeros([1])
         self._count = 0
 
     @property
@@ -44,7 +41,7 @@ class InterfaceRegTracker(object):
 
     def get_and_reset(self):
         loss = self.loss
-        self._loss = Variable(torch.zeros([1]))
+        self._loss = torch.zeros([1])
         self._count = 0
         return loss
 
@@ -54,7 +51,7 @@ def test_simple_reg_fn():
     """ Test whether regularization is correctly calculated. """
     reg_fn = lambda strengths: 2 * strengths
     reg_tracker= InterfaceRegTracker(1., reg_fn=reg_fn)
-    strengths = Variable(torch.ones([10]))
+    strengths = torch.ones([10])
     reg_tracker.regularize(strengths)
     result = sum(reg_tracker.loss.data)
     assert result == 2.,  \
@@ -63,7 +60,7 @@ def test_simple_reg_fn():
 @testcase(binary_reg_fn)
 def test_binary_reg_fn():
     """ Tests whether some values of the function are correct. """
-    inputs = Variable(torch.Tensor([0, .5, 1]))
+    inputs = torch.Tensor([0, .5, 1])
     outputs = binary_reg_fn(inputs).data
     expected = torch.Tensor([0.0029409, 1, 0.0029409])
     assert is_close(outputs, expected).all(), \
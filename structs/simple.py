@@ -1,11 +1,10 @@
-from abc import ABCMeta, abstractmethod
+from abc import abstractmethod
 
 import torch
 from enum import Enum
-from torch.autograd import Variable
 from torch.nn.functional import relu
 
-from base import Struct
+from structs.base import Struct
 
 
 def tensor_to_string(tensor):
@@ -25,25 +24,23 @@ def to_string(obj):
     """
     Formats a PyTorch object as a string.
 
-    :param obj: A PyTorch object (tensor or Variable)
+    :param obj: A PyTorch object
 
     :rtype: str
     :return: A string description of obj
     """
-    if isinstance(obj, torch.FloatTensor):
-        return tensor_to_string(obj)
-    elif isinstance(obj, Variable):
-        return tensor_to_string(obj.data)
+    if isinstance(obj, torch.Tensor):
+        return tensor_to_string(obj.detach())
     else:
         return str(obj)
 
 
 def bottom_to_top(num_steps):
-    return xrange(num_steps)
+    return range(num_steps)
 
 
 def top_to_bottom(num_steps):
-    return reversed(xrange(num_steps))
+    return reversed(range(num_steps))
 
 
 def top(num_steps):
@@ -64,7 +61,8 @@ class SimpleStruct(Struct):
     Abstract class that subsumes the stack and the queue. This class is
     intended for implementing data structures that have the following
     behavior:
-        - self.contents is a list of vectors represented by a matrix
+        - self.contents is a list of vectors, each represented by a
+            [batch size x embedding size] matrix
         - popping consists of removing items from the structure in a
             cascading fashion
         - pushing consists of inserting an item at some position in the
@@ -78,9 +76,8 @@ class SimpleStruct(Struct):
     position in which pushed items are inserted. See Stack and Queue
     below for examples.
     """
-    __metaclass__ = ABCMeta
 
-    def __init__(self, batch_size, embedding_size, k=None):
+    def __init__(self, batch_size, embedding_size, k=None, device=None):
         """
         Constructor for the SimpleStruct object.
 
@@ -90,8 +87,13 @@ class SimpleStruct(Struct):
         :type embedding_size: int
         :param embedding_size: The size of the vectors stored in this
             SimpleStruct
+
+        :type device: torch.device
+        :param device: The device on which the SimpleStruct allocates
+            its tensors. By default, tensors are allocated on the CPU
         """
-        super(SimpleStruct, self).__init__(batch_size, embedding_size)
+        super(SimpleStruct, self).__init__(batch_size, embedding_size,
+                                           device=device)
         self._t = 0
         self._reg_trackers = [None for _ in Operation]
         return
@@ -111,8 +113,9 @@ class SimpleStruct(Struct):
         """
         self._t = xs.size(0)
 
-        self.contents = xs
-        self.strengths = Variable(torch.ones(self._t, self.batch_size))
+        self.contents = list(xs.unbind(0))
+        self.strengths = [torch.ones(self.batch_size, device=xs.device)
+                          for _ in range(self._t)]
 
         return
 
@@ -179,11 +182,10 @@ class SimpleStruct(Struct):
         self._track_reg(strength, Operation.pop)
 
         u = strength
-        s = Variable(torch.FloatTensor(self._t, self.batch_size))
+        s = [None] * self._t
         for i in self._pop_indices():
-            s_i = relu(self.strengths[i, :] - u)
-            u = relu(u - self.strengths[i, :])
-            s[i, :] = s_i
+            s[i] = relu(self.strengths[i] - u)
+            u = relu(u - self.strengths[i])
             # TODO: Figure out a way to break early
         self.strengths = s
 
@@ -210,29 +212,14 @@ class SimpleStruct(Struct):
 
         self._track_reg(strength, Operation.push)
 
-        v = value.view(1, self.batch_size, self.embedding_size)
-        s = Variable(torch.FloatTensor(1, self.batch_size))
-        s[0, :] = strength
-
-        if self._t == 0:
-            self.contents = v
-            self.strengths = s
-        else:
-            i = self._push_index()
-            if i == 0:
-                self.contents = torch.cat([v, self.contents], 0)
-                self.strengths = torch.cat([s, self.strengths], 0)
-            elif i == self._t:
-                self.contents = torch.cat([self.contents, v], 0)
-                self.strengths = torch.cat([self.strengths, s], 0)
-            else:
-                first_v = self.contents[:i, :, :]
-                first_s = self.strengths[:i, :, :]
-                last_v = self.contents[i:, :, :]
-                last_s = self.strengths[i:, :, :]
-
-                self.contents = torch.cat([first_v, v, last_v], 0)
-                self.strengths = torch.cat([first_s, s, last_s], 0)
+        v = value.view(self.batch_size, self.embedding_size)
+        s = strength.view(self.batch_size)
+
+        # Items are never modified after they are pushed, so the new item
+        # is inserted without copying the rest of the SimpleStruct
+        i = self._push_index()
+        self.contents.insert(i, v)
+        self.strengths.insert(i, s)
 
         self._t += 1
         return
@@ -255,14 +242,15 @@ class SimpleStruct(Struct):
         :rtype: Variable
         :return: The output of the read operation, described above
         """
-        r = Variable(torch.zeros([self.batch_size, self.embedding_size]))
-        str_used = Variable(torch.zeros(self.batch_size))
+        r = torch.zeros([self.batch_size, self.embedding_size],
+                        device=self.device)
+        str_used = torch.zeros(self.batch_size, device=self.device)
         for i in self._read_indices():
-            str_i = self.strengths[i, :]
+            str_i = self.strengths[i]
             str_weights = torch.min(str_i, relu(1 - str_used))
             str_weights = str_weights.view(self.batch_size, 1)
             str_weights = str_weights.repeat(1, self.embedding_size)
-            r += str_weights * self.contents[i, :, :]
+            r += str_weights * self.contents[i]
             str_used = str_used + str_i
 
         return r
@@ -311,13 +299,13 @@ class SimpleStruct(Struct):
         if batch < 0 or batch >= self.batch_size:
             raise IndexError("There is no batch {}.".format(batch))
 
-        print "t\t|Strength\t|Value"
-        print "\t|\t\t\t|"
+        print("t\t|Strength\t|Value")
+        print("\t|\t\t\t|")
 
-        for t in reversed(xrange(self._t)):
-            v_str = to_string(self.contents[t, batch, :])
-            s = self.strengths[t, batch].data[0]
-            print "{}\t|{:.4f}\t\t|{}".format(t, s, v_str)
+        for t in reversed(range(self._t)):
+            v_str = to_string(self.contents[t][batch, :])
+            s = self.strengths[t][batch].item()
+            print("{}\t|{:.4f}\t\t|{}".format(t, s, v_str))
 
     def log(self):
         """
@@ -326,8 +314,8 @@ class SimpleStruct(Struct):
 
         :return: None
         """
-        for b in xrange(self.batch_size):
-            print "Batch {}:".format(b)
+        for b in range(self.batch_size):
+            print("Batch {}:".format(b))
             self.print_summary(b)
 
 
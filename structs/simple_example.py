@@ -2,17 +2,15 @@
 Unit tests and usage examples for SimpleStructs.
 """
 import torch
-from torch.autograd import Variable
 
-from simple import Stack, Queue, to_string
-from testing import testcase
+from structs.simple import Stack, Queue, to_string
 
 
 def test_push(s_struct, value, strength):
     v_str = to_string(value)
     s_str = to_string(strength.data)
 
-    print "\nPushing {} with strength {}".format(v_str, s_str)
+    print("\nPushing {} with strength {}".format(v_str, s_str))
     s_struct.push(value, strength)
     s_struct.log()
 
@@ -20,7 +18,7 @@ def test_push(s_struct, value, strength):
 
 
 def test_pop(s_struct, strength):
-    print "\nPopping with strength {:4f}".format(strength)
+    print("\nPopping with strength {:4f}".format(strength))
     s_struct.pop(strength)
     s_struct.log()
 
@@ -30,8 +28,8 @@ def test_pop(s_struct, strength):
 def test_read(s_struct, strength):
     s_str = to_string(strength)
 
-    print "\nReading with strength {}".format(s_str)
-    print to_string(s_struct.read(strength).data[0])
+    print("\nReading with strength {}".format(s_str))
+    print(to_string(s_struct.read(strength).data[0]))
 
     return
 
@@ -47,11 +45,11 @@ else:
     struct = Queue(batch_size, embedding_size)
 
 # Push something
-v1 = Variable(torch.randn(embedding_size))
-v2 = Variable(torch.randn(embedding_size))
-v3 = Variable(torch.randn(embedding_size))
-v4 = Variable(torch.randn(embedding_size))
-s = Variable(torch.FloatTensor([1.]))
+v1 = torch.randn(embedding_size)
+v2 = torch.randn(embedding_size)
+v3 = torch.randn(embedding_size)
+v4 = torch.randn(embedding_size)
+s = torch.FloatTensor([1.])
 
 test_push(struct, v1, s)
 test_push(struct, v2, s)
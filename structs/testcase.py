@@ -1,9 +1,7 @@
-from __future__ import print_function
+import io
 import sys
 import traceback
-import StringIO
 import torch
-from torch.autograd import Variable
 
 
 class testcase(object):
@@ -34,7 +32,7 @@ class testcase(object):
         def wrap_test():
             try:
                 print("Running {}..".format(name), end="")
-                stdout = StringIO.StringIO()
+                stdout = io.StringIO()
                 old_stdout = sys.stdout
                 sys.stdout = stdout
                 test()
@@ -86,7 +84,7 @@ def test_module(module):
 
 def is_close(a, b):
     diff = a - b
-    if isinstance(diff, Variable) or isinstance(diff, torch.Tensor):
+    if isinstance(diff, torch.Tensor):
         abs_fn = torch.abs
     else:
         abs_fn = abs
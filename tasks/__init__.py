@@ -1,3 +1,3 @@
-from base import Task
-from cfg import CFGTask
-from reverse import ReverseTask
\ No newline at end of file
+from tasks.base import Task
+from tasks.cfg import CFGTask
+from tasks.reverse import ReverseTask
\ No newline at end of file
@@ -1,5 +1,3 @@
-from __future__ import division
-
 from abc import ABCMeta, abstractmethod
 
 import torch
@@ -12,7 +10,7 @@ from models.networks.feedforward import LinearSimpleStructNetwork
 from structs.simple import Stack
 
 
-class Task(object):
+class Task(metaclass=ABCMeta):
     """
     Abstract class for creating experiments that train and evaluate a
     neural network model with a neural stack or queue. To create a
@@ -20,7 +18,6 @@ class Task(object):
     the constructor self.__init__ and the functions self.get_data and
     self._evaluate_step.
     """
-    __metaclass__ = ABCMeta
 
     def __init__(self,
                  batch_size=10,
@@ -169,7 +166,7 @@ class Task(object):
         """
         self._print_experiment_start()
         self.get_data()
-        for epoch in xrange(self.epochs):
+        for epoch in range(self.epochs):
             self.run_epoch(epoch)
 
     def run_epoch(self, epoch):
@@ -211,9 +208,9 @@ class Task(object):
         if not self.verbose:
             return
 
-        print "Learning Rate: " + str(self.learning_rate)
-        print "Batch Size: " + str(self.batch_size)
-        print "Read Size: " + str(self.read_size)
+        print("Learning Rate: " + str(self.learning_rate))
+        print("Batch Size: " + str(self.batch_size))
+        print("Read Size: " + str(self.read_size))
 
     def _print_epoch_start(self, epoch):
         """
@@ -228,7 +225,7 @@ class Task(object):
         if not self.verbose:
             return
 
-        print "\n-- Epoch " + str(epoch) + " --\n"
+        print("\n-- Epoch " + str(epoch) + " --\n")
 
     """ Model Training """
 
@@ -247,7 +244,7 @@ class Task(object):
         self.model.train()
 
         last_trial = len(self.train_x.data) - self.batch_size + 1
-        for batch, i in enumerate(xrange(0, last_trial, self.batch_size)):
+        for batch, i in enumerate(range(0, last_trial, self.batch_size)):
             x = self.train_x[i:i + self.batch_size, :, :]
             y = self.train_y[i:i + self.batch_size, :]
             self.model.init_controller(self.batch_size, x)
@@ -292,9 +289,9 @@ class Task(object):
 
         # Read the input from left to right and evaluate the output
         num_steps = self.time_function(self.max_x_length)
-        for j in xrange(num_steps):
+        for j in range(num_steps):
             self.model()
-        for j in xrange(self.max_x_length):
+        for j in range(self.max_x_length):
             a = self.model.read_output()
             loss, correct, total = self._evaluate_step(x, y, a, j)
             if loss is None or correct is None or total is None:
@@ -383,11 +380,11 @@ class Task(object):
 
         if is_batch:
             message = "Batch {}: ".format(name)
-            loss = sum(batch_loss.data) / self.batch_size
+            loss = batch_loss.item() / self.batch_size
         else:
             message = "Epoch {} Test: ".format(name)
-            loss = sum(batch_loss.data) / self.test_x.size(0)
+            loss = batch_loss.item() / self.test_x.size(0)
 
         accuracy = (batch_correct * 1.0) / batch_total
         message += "Loss = {:.4f}, Accuracy = {:.2f}".format(loss, accuracy)
-        print message
+        print(message)
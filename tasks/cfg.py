@@ -11,17 +11,14 @@ data are generated for training and testing. In all tasks below, the
 data are generated by some sort of context-free grammar.
 """
 # TODO: Make another version of CFGTask for PCFGs
-from __future__ import division
-
 import random
 
 import nltk.grammar as gr
 import torch
 import torch.nn as nn
 from nltk.parse.generate import generate
-from torch.autograd import Variable
 
-from base import Task
+from tasks.base import Task
 from models import VanillaController
 from models.networks.feedforward import LinearSimpleStructNetwork
 from structs import Stack
@@ -35,9 +32,7 @@ class CFGTask(Task):
     """
 
     def __init__(self,
-                 grammar,
-                 to_predict,
-                 sample_depth,
+                 config,
                  batch_size=10,
                  criterion=nn.CrossEntropyLoss(),
                  cuda=False,
@@ -58,22 +53,18 @@ class CFGTask(Task):
                  verbose=True):
         """
         Constructor for the CFGTask object. To create a CFGTask, the
-        user must specify a grammar to sample sentences from, a list of
-        words that will be predicted as part of the task, the depth to
-        which sentences from the grammar will be sampled to create
-        training and testing data sets, and the type of neural network
-        model that will be trained and evaluated.
-
-        :type grammar: gr.CFG
-        :param grammar: The context-free grammar that will generate
-            training and testing data
-
-        :type to_predict: list
-        :param to_predict: The words that will be predicted in this task
-
-        :type sample_depth: int
-        :param sample_depth: The maximum depth to which sentences will
-            be sampled from the grammar
+        user must specify a config containing a grammar to sample
+        sentences from, a list of words that will be predicted as part
+        of the task, and the depth to which sentences from the grammar
+        will be sampled to create training and testing data sets, as
+        well as the type of neural network model that will be trained
+        and evaluated.
+
+        :type config: tasks.configs.CFGConfig
+        :param config: The grammar that will generate training and
+            testing data, the words that will be predicted in this task,
+            and the maximum depth to which sentences will be sampled
+            from the grammar
 
         :type batch_size: int
         :param batch_size: The number of trials in each mini-batch
@@ -135,7 +126,7 @@ class CFGTask(Task):
         :param verbose: If True, the progress of the experiment will be
             displayed in the console
         """
-        self.grammar = grammar
+        self.grammar = config.grammar
         self.code_for = self._get_code_for(null)
         self.num_words = len(self.code_for)
 
@@ -156,8 +147,9 @@ class CFGTask(Task):
                                       load_path=load_path,
                                       verbose=verbose)
 
-        self.to_predict_code = self.words_to_code(*to_predict)
-        self.sample_depth = sample_depth
+        self.to_predict_code = frozenset(
+            self.words_to_code(*config.to_predict))
+        self.sample_depth = config.sample_depth
         self.null = null
         self.max_length = max_length
 
@@ -168,7 +160,7 @@ class CFGTask(Task):
 
         return
 
-    def reset_model(self, model_type):
+    def reset_model(self, model_type, network_type, struct_type):
         """
         Instantiates a neural network model of a given type that is
         compatible with this Task. This function must set self.model to
@@ -179,9 +171,19 @@ class CFGTask(Task):
             the desired model's *type* to this parameter, not an
             instance thereof
 
+        :type network_type: type
+        :param network_type: The type of the Network that will perform
+            the neural network computations
+
+        :type struct_type: type
+        :param struct_type: The type of neural data structure that this
+            Controller will operate
+
         :return: None
         """
-        self.model = model_type(self.num_words, self.read_size, self.num_words)
+        self.model = model_type(self.num_words, self.read_size, self.num_words,
+                                network_type=network_type,
+                                struct_type=struct_type)
 
     def _get_code_for(self, null):
         """
@@ -245,8 +247,8 @@ class CFGTask(Task):
         # Find the batch trials where we make a prediction
         null = self.code_for[self.null]
         valid_x = (y[:, j] != null).type(torch.FloatTensor)
-        for k in xrange(len(valid_x)):
-            if y[k, j].data[0] not in self.to_predict_code:
+        for k in range(len(valid_x)):
+            if y[k, j].item() not in self.to_predict_code:
                 valid_x[k] = 0
 
         correct_trials = (y_pred == y[:, j]).type(torch.FloatTensor)
@@ -310,7 +312,7 @@ class CFGTask(Task):
         :return: A Variable containing the input dataset and a Variable
             containing the output dataset
         """
-        x_raw = [self.get_random_sample_string() for _ in xrange(num_tensors)]
+        x_raw = [self.get_random_sample_string() for _ in range(num_tensors)]
         y_raw = [s[1:] for s in x_raw]
 
         # Initialize x to all nulls
@@ -334,7 +336,7 @@ class CFGTask(Task):
             for j, word in enumerate(words_code[:self.max_length]):
                 y[i, j] = word
 
-        return Variable(x), Variable(y)
+        return x, y
 
     def get_random_sample_string(self):
         """
@@ -394,4 +396,4 @@ class CFGTask(Task):
         :rtype: torch.FloatTensor
         :return: The one-hot encoding of number
         """
-        return torch.FloatTensor([float(i == number) for i in xrange(size)])
+        return torch.FloatTensor([float(i == number) for i in range(size)])
@@ -1,42 +1,64 @@
 """ Defines Task parameters for notable experiment configurations.
 
-The values in a config dictionary are used to populate the parameters of a Task constructor.
+A config is passed to the Task constructor it was written for, which reads its fields.
+Configs are frozen dataclasses, so running an experiment cannot modify them.
 
 Example usage:
-  CFGTask(**tasks.configs.dyck_config).run_experiment()
+  CFGTask(tasks.configs.dyck_config).run_experiment()
 
 """
 
+from dataclasses import dataclass
+from typing import Tuple
+
 from formalisms.cfg import *
+from models.networks.feedforward import LinearSimpleStructNetwork
 from models.networks.recurrent import LSTMSimpleStructNetwork, RNNSimpleStructNetwork
 
-dyck_config = {
-    "grammar": dyck_grammar,
-    "to_predict": [u")", u"]"],
-    "sample_depth": 5,
-}
-
-
-reverse_config = {
-    "grammar": reverse_grammar,
-    "to_predict": [u"a1", u"b1"],
-    "sample_depth": 12,
-}
-
-reverse_RNN = {
-    "network_type": RNNSimpleStructNetwork,
-    "learning_rate": 0.01,
-    "epochs": 100
-}
-
-reverse_LSTM = {
-    "network_type": LSTMSimpleStructNetwork,
-    "learning_rate": 0.01,
-    "epochs": 100
-}
-
-agreement_config = {
-    "grammar": agreement_grammar,
-    "to_predict": [u"Auxsing", u"Auxplur"],
-    "sample_depth": 8,
-}
+
+@dataclass(frozen=True, slots=True)
+class CFGConfig:
+    """ The grammar and prediction targets of a CFGTask. """
+    grammar: CFG
+    to_predict: Tuple[str, ...]
+    sample_depth: int
+
+
+@dataclass(frozen=True, slots=True)
+class ReverseConfig:
+    """ The training hyperparameters of a ReverseTask. """
+    network_type: type = LinearSimpleStructNetwork
+    learning_rate: float = 0.01
+    epochs: int = 30
+
+
+dyck_config = CFGConfig(
+    grammar=dyck_grammar,
+    to_predict=(")", "]"),
+    sample_depth=5,
+)
+
+
+reverse_config = CFGConfig(
+    grammar=reverse_grammar,
+    to_predict=("a1", "b1"),
+    sample_depth=12,
+)
+
+reverse_RNN = ReverseConfig(
+    network_type=RNNSimpleStructNetwork,
+    learning_rate=0.01,
+    epochs=100,
+)
+
+reverse_LSTM = ReverseConfig(
+    network_type=LSTMSimpleStructNetwork,
+    learning_rate=0.01,
+    epochs=100,
+)
+
+agreement_config = CFGConfig(
+    grammar=agreement_grammar,
+    to_predict=("Auxsing", "Auxplur"),
+    sample_depth=8,
+)
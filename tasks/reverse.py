@@ -1,14 +1,11 @@
-from __future__ import division
-
 import random
 
 import torch
 import torch.nn as nn
-from torch.autograd import Variable
 
-from base import Task
+from tasks.base import Task
+from tasks.configs import ReverseConfig
 from models import VanillaController
-from models.networks.feedforward import LinearSimpleStructNetwork
 from structs import Stack
 
 class ReverseTask(Task):
@@ -17,6 +14,7 @@ class ReverseTask(Task):
     """
 
     def __init__(self,
+                 config=ReverseConfig(),
                  min_length=1,
                  max_length=12,
                  mean_length=10,
@@ -24,12 +22,9 @@ class ReverseTask(Task):
                  batch_size=10,
                  criterion=nn.CrossEntropyLoss(),
                  cuda=False,
-                 epochs=30,
-                 learning_rate=0.01,
                  l2_weight=0.01,
                  model=None,
                  model_type=VanillaController,
-                 network_type=LinearSimpleStructNetwork,
                  read_size=2,
                  struct_type=Stack,
                  time_function=(lambda t: t),
@@ -41,6 +36,12 @@ class ReverseTask(Task):
         that needs to be specified by the user is information about the
         distribution of the strings appearing in the input data.
 
+        :type config: tasks.configs.ReverseConfig
+        :param config: The type of neural network that will drive the
+            Controller, the learning rate used for training, and the
+            number of training epochs that will be performed when
+            executing an experiment
+
         :type min_length: int
         :param min_length: The shortest possible length of an input
             string
@@ -65,13 +66,6 @@ class ReverseTask(Task):
         :type cuda: bool
         :param cuda: If True, CUDA functionality will be used
 
-        :type epochs: int
-        :param epochs: The number of training epochs that will be
-            performed when executing an experiment
-
-        :type learning_rate: float
-        :param learning_rate: The learning rate used for training
-
         :type l2_weight: float
         :param l2_weight: The amount of l2 regularization used for
             training
@@ -85,10 +79,6 @@ class ReverseTask(Task):
         :param model_type: The type of Controller that will be trained
             and evaluated
 
-        :type network_type: type
-        :param network_type: The type of neural network that will drive
-            the Controller
-
         :type read_size: int
         :param read_size: The length of the vectors stored on the neural
             data structure
@@ -109,14 +99,14 @@ class ReverseTask(Task):
         super(ReverseTask, self).__init__(batch_size=batch_size,
                                           criterion=criterion,
                                           cuda=cuda,
-                                          epochs=epochs,
-                                          learning_rate=learning_rate,
+                                          epochs=config.epochs,
+                                          learning_rate=config.learning_rate,
                                           l2_weight=l2_weight,
                                           max_x_length=max_length * 2,
                                           max_y_length=max_length * 8,
                                           model=model,
                                           model_type=model_type,
-                                          network_type=network_type,
+                                          network_type=config.network_type,
                                           read_size=read_size,
                                           struct_type=struct_type,
                                           time_function=time_function,
@@ -188,7 +178,7 @@ class ReverseTask(Task):
             total guesses at the jth time step
         """
         indices = (y[:, j] != 2)
-        valid_a = a[indices.view(-1, 1)].view(-1, 3)
+        valid_a = a[indices]
         valid_y = y[:, j][indices]
         if len(valid_a) == 0:
             return None, None, None
@@ -226,7 +216,7 @@ class ReverseTask(Task):
         """
         length = int(random.gauss(self.mean_length, self.std_length))
         length = min(max(self.min_length, length), self.max_length)
-        return [random.randint(0, 1) for _ in xrange(length)]
+        return [random.randint(0, 1) for _ in range(length)]
 
     def get_tensors(self, b):
         """
@@ -248,7 +238,7 @@ class ReverseTask(Task):
         :return: A Variable containing the input values and a Variable
             containing the output values
         """
-        x_raw = [self.randstr() for _ in xrange(b)]
+        x_raw = [self.randstr() for _ in range(b)]
 
         # Initialize x to one-hot encodings of NULL
         x = torch.FloatTensor(b, 2 * self.max_length, 3)
@@ -265,7 +255,7 @@ class ReverseTask(Task):
                 x[i, j, :] = ReverseTask.one_hot(char)
                 y[i, j + len(s)] = t[j]
 
-        return Variable(x), Variable(y)
+        return x, y
 
     @staticmethod
     def reverse(s):
@@ -297,7 +287,7 @@ class ReverseTask(Task):
         :rtype: torch.FloatTensor
         :return: The one-hot encoding of b
         """
-        return torch.FloatTensor([float(i == b) for i in xrange(3)])
+        return torch.FloatTensor([float(i == b) for i in range(3)])
 
 
 class CopyTask(ReverseTask):
@@ -322,7 +312,7 @@ class CopyTask(ReverseTask):
         :return: A Variable containing the input values and a Variable
             containing the output values
         """
-        x_raw = [self.randstr() for _ in xrange(b)]
+        x_raw = [self.randstr() for _ in range(b)]
 
         # Initialize x to one-hot encodings of NULL
         x = torch.FloatTensor(b, 2 * self.max_length, 3)
@@ -339,4 +329,4 @@ class CopyTask(ReverseTask):
                 x[i, j, :] = ReverseTask.one_hot(char)
                 y[i, j] = t[j]
 
-        return Variable(x), Variable(y)
+        return x, y